@@ -596,7 +596,16 @@ function CoachTab() {
     },
   });
 
+  const isUnchanged =
+    savedSettings &&
+    settings.coach_type === savedSettings.coach_type &&
+    settings.training_plan === savedSettings.training_plan &&
+    settings.time_constraint === savedSettings.time_constraint &&
+    (settings.weekly_hours_available ?? null) === (savedSettings.weekly_hours_available ?? null);
+
   const handleSave = () => {
+    // Skip the round-trip when nothing differs from the saved settings
+    if (isUnchanged) return;
     mutation.mutate(settings);
   };
 
@@ -773,7 +782,7 @@ function CoachTab() {
       <div className="pt-4 border-t border-slate-200">
         <button
           onClick={handleSave}
-          disabled={mutation.isPending}
+          disabled={mutation.isPending || !!isUnchanged}
           className="px-4 py-2 bg-blue-600 hover:bg-blue-700 text-white rounded-lg transition-colors disabled:opacity-50"
         >
           {mutation.isPending ? 'Saving...' : 'Save Coach Settings'}
@@ -198,13 +198,18 @@ export async function chatStream(
 
   const reader = response.body?.getReader();
   const decoder = new TextDecoder();
+  // Carry partial SSE lines across reads: a network chunk can end
+  // mid-line (or mid-codepoint, hence stream: true) and the tail would
+  // otherwise be dropped.
+  let buffer = '';
 
   while (reader) {
     const { done, value } = await reader.read();
     if (done) break;
 
-    const chunk = decoder.decode(value);
-    const lines = chunk.split('\n');
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop() ?? '';
     for (const line of lines) {
       if (line.startsWith('data: ') && line !== 'data: [DONE]') {
         try {